@@ -1,5 +1,8 @@
 """Main API."""
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 import nltk
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -10,11 +13,17 @@ from phoenix.trace.langchain import LangChainInstrumentor
 from agent.routes import collection, delete, embeddings, rag, search
 from agent.utils.vdb import initialize_all_vector_dbs
 
-LangChainInstrumentor().instrument()
-nltk.download("punkt")
-nltk.download("punkt_tab")
-initialize_all_vector_dbs()
-logger.info("Startup.")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
+    """Run the blocking initialization at startup instead of import time."""
+    LangChainInstrumentor().instrument()
+    nltk.download("punkt")
+    nltk.download("punkt_tab")
+    initialize_all_vector_dbs()
+    logger.info("Startup.")
+    yield
+
 
 logger.info(
     """
@@ -46,7 +55,7 @@ def my_schema() -> dict:
     return app.openapi_schema
 
 
-app = FastAPI(debug=True)
+app = FastAPI(debug=True, lifespan=lifespan)
 app.openapi = my_schema
 
 load_dotenv(override=True)
@@ -1,8 +1,50 @@
 """Strategy Pattern."""
 
+import asyncio
+import itertools
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
 
-from agent.data_model.request_data_model import LLMBackend, SearchParams
+from langchain_community.document_loaders import DirectoryLoader, PyPDFium2Loader, TextLoader
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import chain
+from langchain_text_splitters import NLTKTextSplitter
+from loguru import logger
+
+from agent.data_model.request_data_model import SearchParams
+from agent.utils.caching import query_cache
+
+SUPPORTED_FILE_ENDINGS = {".pdf", ".txt", ".md"}
+
+
+def _load_file(path: str, file_ending: str) -> list[Document]:
+    """Load a single file; runs in a worker process because PDF parsing is CPU-bound."""
+    loader_cls = PyPDFium2Loader if file_ending == ".pdf" else TextLoader
+    return loader_cls(path).load()
+
+
+def _prepare_chunks(docs: list[Document]) -> tuple[list[str], list[dict]]:
+    """Turn split documents into text and metadata lists ready for upserting.
+
+    Args:
+    ----
+        docs (list[Document]): The split documents.
+
+    Returns:
+    -------
+        tuple[list[str], list[dict]]: The chunk texts and their metadata.
+
+    """
+    # sort by chunk length so every embedding batch holds similarly sized payloads
+    docs.sort(key=lambda doc: len(doc.page_content))
+    text_list = [doc.page_content for doc in docs]
+    # keep only the file name of the source path
+    metadata_list = [{**doc.metadata, "source": doc.metadata["source"].rsplit("/", 1)[-1]} for doc in docs]
+
+    return text_list, metadata_list
 
 
 class LLMBase(ABC):
@@ -13,18 +55,141 @@ class LLMBase(ABC):
         """Init the LLM Base."""
         self.collection_name = collection_name
 
-    @abstractmethod
-    def embed_documents(self, directory: str, llm_backend: LLMBackend) -> None:
-        """Embedd new docments in the Qdrant DB."""
+    def embed_documents(self, directory: str, file_ending: str = ".pdf") -> None:
+        """Embeds the documents in the given directory.
+
+        Args:
+        ----
+            directory (str): PDF Directory.
+            file_ending (str): File ending of the documents.
+
+        """
+        if file_ending == ".pdf":
+            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=PyPDFium2Loader)
+        elif file_ending in {".txt", ".md"}:
+            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=TextLoader)
+        else:
+            msg = "File ending not supported."
+            raise ValueError(msg)
+
+        splitter = NLTKTextSplitter(length_function=len, chunk_size=500, chunk_overlap=75)
+
+        # stream the files through the splitter instead of materializing the whole corpus first
+        docs = splitter.split_documents(loader.lazy_load())
+
+        logger.info(f"Loaded {len(docs)} documents.")
+        text_list, metadata_list = _prepare_chunks(docs)
+
+        batch_size = self.cfg.document_ingestion.batch_size
+        batches = [(text_list[i : i + batch_size], metadata_list[i : i + batch_size]) for i in range(0, len(text_list), batch_size)]
+        if not batches:
+            logger.info("No chunks to embed.")
+            return
+        *queued, final = batches
+
+        def upsert_batch(batch: tuple[list[str], list[dict]]) -> None:
+            texts, metadatas = batch
+            # wait=False: do not block on the server-side WAL flush per batch
+            self.vector_db.add_texts(texts=texts, metadatas=metadatas, batch_size=batch_size, wait=False)
+
+        # two workers so embedding batch n+1 overlaps the upsert of batch n
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(upsert_batch, queued))
+
+        # the final batch is submitted after all queued ones and waits for
+        # server-side application, so the whole ingest is searchable on return
+        self.vector_db.add_texts(texts=final[0], metadatas=final[1], batch_size=batch_size, wait=True)
+
+        logger.info("SUCCESS: Texts embedded.")
+
+    async def aembed_documents(self, directory: str, file_ending: str = ".pdf") -> None:
+        """Embeds the documents in the given directory with bounded concurrency.
+
+        Chunk batches are upserted concurrently with asyncio.gather; a semaphore
+        caps the number of in-flight embedding requests so the provider is not
+        flooded.
+
+        Args:
+        ----
+            directory (str): PDF Directory.
+            file_ending (str): File ending of the documents.
+
+        """
+        if file_ending not in SUPPORTED_FILE_ENDINGS:
+            msg = "File ending not supported."
+            raise ValueError(msg)
+
+        splitter = NLTKTextSplitter(length_function=len, chunk_size=500, chunk_overlap=75)
+
+        # parse the files across worker processes so PDF parsing neither blocks
+        # the event loop nor serializes on one core
+        paths = sorted(str(path) for path in Path(directory).glob("*" + file_ending))
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 8)) as pool:
+            page_lists = await asyncio.gather(*(loop.run_in_executor(pool, _load_file, path, file_ending) for path in paths))
+
+        docs = splitter.split_documents(itertools.chain.from_iterable(page_lists))
+
+        logger.info(f"Loaded {len(docs)} documents.")
+        text_list, metadata_list = _prepare_chunks(docs)
+
+        batch_size = self.cfg.document_ingestion.batch_size
+        batches = [(text_list[i : i + batch_size], metadata_list[i : i + batch_size]) for i in range(0, len(text_list), batch_size)]
+        if not batches:
+            logger.info("No chunks to embed.")
+            return
+        *queued, final = batches
+        semaphore = asyncio.Semaphore(self.cfg.document_ingestion.max_in_flight_batches)
+
+        async def upsert_batch(texts: list[str], metadatas: list[dict]) -> None:
+            async with semaphore:
+                # wait=False: do not block on the server-side WAL flush per batch
+                await self.vector_db.aadd_texts(texts=texts, metadatas=metadatas, batch_size=batch_size, wait=False)
+
+        await asyncio.gather(*(upsert_batch(texts, metadatas) for texts, metadatas in queued))
+
+        # the final batch is submitted after all queued ones and waits for
+        # server-side application, so the whole ingest is searchable on return
+        await self.vector_db.aadd_texts(texts=final[0], metadatas=final[1], batch_size=batch_size, wait=True)
+
+        logger.info("SUCCESS: Texts embedded.")
 
     @abstractmethod
     def create_collection(self, name: str) -> bool:
         """Create a new collection in the Vector Database."""
 
-    @abstractmethod
-    def create_search_chain(self, search: SearchParams) -> list:
+    def create_search_chain(self, search: SearchParams) -> BaseRetriever:
         """Searches the documents in the Qdrant DB with semantic search."""
 
+        @chain
+        def retriever_with_score(query: str) -> list[Document]:
+            """Defines a retriever that returns the score.
+
+            Args:
+            ----
+                query (str): Query the user asks.
+
+            Returns:
+            -------
+                list[Document]: List of Langchain Documents.
+
+            """
+            cache_key = (self.collection_name, query, search.k, search.score_threshold, repr(search.filter))
+            cached_docs = query_cache.get(cache_key)
+            if cached_docs is not None:
+                return cached_docs
+
+            docs = []
+            for doc, score in self.vector_db.similarity_search_with_score(query, k=search.k, filter=search.filter, score_threshold=search.score_threshold):
+                # native float: JSON-serializable and 4x smaller than a NumPy scalar
+                doc.metadata["score"] = float(score)
+                docs.append(doc)
+
+            query_cache.set(cache_key, docs)
+            return docs
+
+        return retriever_with_score
+
     @abstractmethod
     def summarize_text(self, text: str) -> str:
         """Summarize text."""
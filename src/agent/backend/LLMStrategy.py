@@ -28,6 +28,10 @@ class LLMStrategyFactory:
         LLMProvider.OLLAMA: OllamaService,
     }
 
+    # constructed services per (provider, collection); building one sets up
+    # embedding and vector DB clients, so reuse instead of rebuilding per request
+    _instances: ClassVar[dict[tuple, LLMBase]] = {}
+
     @staticmethod
     def get_strategy(strategy_type: str, collection_name: str) -> LLMBase:
         """Get the correct strategy.
@@ -47,11 +51,16 @@ class LLMStrategyFactory:
             LLMBase: _description_
 
         """
-        strategy = LLMStrategyFactory._strategies.get(strategy_type)
-        if strategy is None:
+        if strategy_type not in LLMStrategyFactory._strategies:
             msg = "Unknown Strategy Type"
             raise ValueError(msg)
-        return strategy(collection_name=collection_name)
+
+        key = (strategy_type, collection_name)
+        instance = LLMStrategyFactory._instances.get(key)
+        if instance is None:
+            instance = LLMStrategyFactory._strategies[strategy_type](collection_name=collection_name)
+            LLMStrategyFactory._instances[key] = instance
+        return instance
 
 
 class LLMContext:
@@ -67,12 +76,16 @@ class LLMContext:
 
     def search(self, search: SearchParams) -> list:
         """Wrapper for the search."""
-        return self.llm.create_search_chain(search=search)
+        return self.llm.create_search_chain(search=search).invoke(search.query)
 
     def embed_documents(self, directory: str, file_ending: str) -> None:
         """Wrapper for the Embedding of Documents."""
         return self.llm.embed_documents(directory=directory, file_ending=file_ending)
 
+    async def aembed_documents(self, directory: str, file_ending: str) -> None:
+        """Wrapper for the concurrent Embedding of Documents."""
+        return await self.llm.aembed_documents(directory=directory, file_ending=file_ending)
+
     def create_collection(self, name: str) -> None:
         """Wrapper for creating a collection."""
         return self.llm.create_collection(name)
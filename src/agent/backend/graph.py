@@ -2,6 +2,7 @@
 
 import os
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Annotated, Literal, TypedDict
 
 from langchain_cohere import ChatCohere, CohereEmbeddings
@@ -34,6 +35,9 @@ OPENAI_MODEL_KEY = "openai_gpt_3_5_turbo"
 COHERE_MODEL_KEY = "cohere_command"
 OLLAMA_MODEL_KEY = "ollama_llama8b3.1"
 
+# parsed once at import time instead of on every chat-history retrieval
+CONDENSE_QUESTION_PROMPT = PromptTemplate.from_template(REPHRASE_TEMPLATE)
+
 
 class AgentState(TypedDict):
     """State of the Agent."""
@@ -66,6 +70,7 @@ llm = gpt4o.configurable_alternatives(
 ).with_fallbacks([cohere_command, ollama_chat])
 
 
+@lru_cache(maxsize=1)
 def get_score_retriever() -> BaseRetriever:
     """Get the Retriever.
 
@@ -76,7 +81,7 @@ def get_score_retriever() -> BaseRetriever:
     """
     embedding = CohereEmbeddings(model="embed-multilingual-v3.0")
 
-    qdrant_client = QdrantClient("http://localhost", port=6333, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=False)
+    qdrant_client = QdrantClient("http://localhost", port=6333, grpc_port=6334, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=True)
 
     vector_db = Qdrant(client=qdrant_client, collection_name="cohere", embeddings=embedding)
 
@@ -93,15 +98,18 @@ def get_score_retriever() -> BaseRetriever:
             list[Document]: List of Langchain Documents.
 
         """
-        docs, scores = zip(*vector_db.similarity_search_with_score(query), strict=False)
-        for doc, score in zip(docs, scores, strict=False):
-            doc.metadata["score"] = score
+        docs = []
+        for doc, score in vector_db.similarity_search_with_score(query):
+            # native float: JSON-serializable and 4x smaller than a NumPy scalar
+            doc.metadata["score"] = float(score)
+            docs.append(doc)
 
         return docs
 
     return retriever_with_score
 
 
+@lru_cache(maxsize=1)
 def get_retriever() -> BaseRetriever:
     """Create a Vector Database retriever.
 
@@ -112,7 +120,7 @@ def get_retriever() -> BaseRetriever:
     """
     embedding = CohereEmbeddings(model="embed-multilingual-v3.0")
 
-    qdrant_client = QdrantClient("http://localhost", port=6333, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=False)
+    qdrant_client = QdrantClient("http://localhost", port=6333, grpc_port=6334, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=True)
 
     vector_db = Qdrant(client=qdrant_client, collection_name="cohere", embeddings=embedding)
     return vector_db.as_retriever(search_kwargs={"k": 4})
@@ -152,8 +160,7 @@ def retrieve_documents_with_chat_history(state: AgentState) -> AgentState:
     retriever = get_retriever()
     model = llm.with_config(tags=["nostream"])
 
-    condense_queston_prompt = PromptTemplate.from_template(REPHRASE_TEMPLATE)
-    condense_question_chain = (condense_queston_prompt | model | StrOutputParser()).with_config(
+    condense_question_chain = (CONDENSE_QUESTION_PROMPT | model | StrOutputParser()).with_config(
         run_name="CondenseQuestion",
     )
 
@@ -201,28 +208,43 @@ def get_chat_history(messages: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
     ]
 
 
-def generate_response(state: AgentState, model: LanguageModelLike, prompt_template: str) -> AgentState:
-    """Create a response from the model.
+@lru_cache(maxsize=8)
+def get_chat_prompt(prompt_template: str) -> ChatPromptTemplate:
+    """Build the chat prompt for a system template once and reuse it.
 
     Args:
     ----
-        state (AgentState): Graph State.
-        model (LanguageModelLike): Language Model.
-        prompt_template (str): Template for the prompt.
+        prompt_template (str): Template for the system message.
 
     Returns:
     -------
-        AgentState: Modified Graph State.
+        ChatPromptTemplate: The compiled chat prompt.
 
     """
-    prompt = ChatPromptTemplate.from_messages(
+    return ChatPromptTemplate.from_messages(
         [
             ("system", prompt_template),
             ("placeholder", "{chat_history}"),
             ("human", "{question}"),
         ]
     )
-    response_synthesizer = prompt | model
+
+
+def generate_response(state: AgentState, model: LanguageModelLike, prompt_template: str) -> AgentState:
+    """Create a response from the model.
+
+    Args:
+    ----
+        state (AgentState): Graph State.
+        model (LanguageModelLike): Language Model.
+        prompt_template (str): Template for the prompt.
+
+    Returns:
+    -------
+        AgentState: Modified Graph State.
+
+    """
+    response_synthesizer = get_chat_prompt(prompt_template) | model
     synthesized_response = response_synthesizer.invoke(
         {
             "question": state["query"],
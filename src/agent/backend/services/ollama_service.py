@@ -1,25 +1,27 @@
 """Ollama Backend."""
 
+from functools import lru_cache
+
 from dotenv import load_dotenv
-from langchain_community.document_loaders import DirectoryLoader, PyPDFium2Loader, TextLoader
 from langchain_community.embeddings import OllamaEmbeddings
-from langchain_core.documents import Document
-from langchain_core.retrievers import BaseRetriever
-from langchain_core.runnables import chain
-from langchain_text_splitters import NLTKTextSplitter
+from langchain_core.embeddings import Embeddings
 from loguru import logger
 from omegaconf import DictConfig
 from ultra_simple_config import load_config
 
 from agent.backend.LLMBase import LLMBase
-from agent.data_model.request_data_model import (
-    SearchParams,
-)
+from agent.utils.caching import cache_embeddings
 from agent.utils.vdb import generate_collection, init_vdb
 
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
+def get_ollama_embedder(model_name: str) -> Embeddings:
+    """Create or reuse the Ollama embedder so all service instances share one HTTP session."""
+    return cache_embeddings(OllamaEmbeddings(model=model_name), namespace=model_name)
+
+
 class OllamaService(LLMBase):
     """Wrapper for Ollama llms."""
 
@@ -35,75 +37,13 @@ class OllamaService(LLMBase):
         else:
             self.collection_name = self.cfg.qdrant.collection_name_ollama
 
-        embedding = OllamaEmbeddings(model=self.cfg.ollama_embeddings.embedding_model_name)
-
-        self.vector_db = init_vdb(self.cfg, self.collection_name, embedding=embedding)
-
-    def embed_documents(self, directory: str, file_ending: str = ".pdf") -> None:
-        """Embeds the documents in the given directory.
-
-        Args:
-        ----
-            directory (str): PDF Directory.
-            file_ending (str): File ending of the documents.
-
-        """
-        if file_ending == ".pdf":
-            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=PyPDFium2Loader)
-        elif file_ending == ".txt":
-            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=TextLoader)
-        else:
-            msg = "File ending not supported."
-            raise ValueError(msg)
-
-        splitter = NLTKTextSplitter(length_function=len, chunk_size=500, chunk_overlap=75)
-
-        docs = loader.load_and_split(splitter)
-
-        logger.info(f"Loaded {len(docs)} documents.")
-        text_list = [doc.page_content for doc in docs]
-        metadata_list = [doc.metadata for doc in docs]
-
-        for m in metadata_list:
-            # only when there are / in the source
-            if "/" in m["source"]:
-                m["source"] = m["source"].split("/")[-1]
-
-        self.vector_db.add_texts(texts=text_list, metadatas=metadata_list)
-
-        logger.info("SUCCESS: Texts embedded.")
+        self.vector_db = init_vdb(self.cfg, self.collection_name, embedding=get_ollama_embedder(self.cfg.ollama_embeddings.embedding_model_name))
 
     def create_collection(self, name: str) -> bool:
         """Create a new collection in the Vector Database."""
-        generate_collection(self.vector_db, name, self.cfg.qdrant.embeddings_size)
+        generate_collection(name, self.cfg.ollama_embeddings.size)
         return True
 
-    def create_search_chain(self, search: SearchParams) -> BaseRetriever:
-        """Searches the documents in the Qdrant DB with semantic search."""
-
-        @chain
-        def retriever_with_score(query: str) -> list[Document]:
-            """Defines a retriever that returns the score.
-
-            Args:
-            ----
-                query (str): Query the user asks.
-
-            Returns:
-            -------
-                list[Document]: List of Langchain Documents.
-
-            """
-            docs, scores = zip(
-                *self.vector_db.similarity_search_with_score(query, k=search.k, filter=search.filter, score_threshold=search.score_threshold), strict=False
-            )
-            for doc, score in zip(docs, scores, strict=False):
-                doc.metadata["score"] = score
-
-            return docs
-
-        return retriever_with_score
-
     def summarize_text(self, text: str) -> str:
         """Summarize text."""
 
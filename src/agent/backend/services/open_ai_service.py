@@ -1,13 +1,12 @@
 """Script is used to initialize the Qdrant db backend with (Azure) OpenAI."""
 
 import os
+from functools import lru_cache
 
 import openai
 from dotenv import load_dotenv
-from langchain.text_splitter import NLTKTextSplitter
-from langchain_community.document_loaders import DirectoryLoader, PyPDFium2Loader, TextLoader
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import chain
 from langchain_openai.embeddings import AzureOpenAIEmbeddings, OpenAIEmbeddings
 from loguru import logger
 from omegaconf import DictConfig
@@ -15,12 +14,27 @@ from ultra_simple_config import load_config
 
 from agent.backend.LLMBase import LLMBase
 from agent.data_model.request_data_model import RAGRequest, SearchParams
+from agent.utils.caching import cache_embeddings
 from agent.utils.utility import load_prompt_template
 from agent.utils.vdb import generate_collection, init_vdb
 
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
+def get_openai_embedder(model_name: str, azure: bool, openai_api_version: str) -> Embeddings:
+    """Create or reuse the (Azure) OpenAI embedder so all service instances share one HTTP session."""
+    if azure:
+        embedding = AzureOpenAIEmbeddings(
+            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            deployment=model_name,
+            openai_api_version=openai_api_version,
+        )
+    else:
+        embedding = OpenAIEmbeddings(model=model_name)
+    return cache_embeddings(embedding, namespace=model_name)
+
+
 class OpenAIService(LLMBase):
     """OpenAI Backend Service."""
 
@@ -40,14 +54,9 @@ class OpenAIService(LLMBase):
         template = load_prompt_template(prompt_name="cohere_chat.j2", task="chat")
         self.prompt = ChatPromptTemplate.from_template(template=template, template_format="jinja2")
 
-        if self.cfg.openai_embeddings.azure:
-            embedding = AzureOpenAIEmbeddings(
-                azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-                deployment=self.cfg.openai_embeddings.embedding_model_name,
-                openai_api_version=self.cfg.openai_embeddings.openai_api_version,
-            )
-        else:
-            embedding = OpenAIEmbeddings(model=self.cfg.openai_embeddings.embedding_model_name)
+        embedding = get_openai_embedder(
+            self.cfg.openai_embeddings.embedding_model_name, self.cfg.openai_embeddings.azure, self.cfg.openai_embeddings.openai_api_version
+        )
 
         self.vector_db = init_vdb(self.cfg, self.collection_name, embedding=embedding)
 
@@ -63,40 +72,6 @@ class OpenAIService(LLMBase):
         logger.info(f"SUCCESS: Collection {name} created.")
         return True
 
-    def embed_documents(self, directory: str, file_ending: str = ".pdf") -> None:
-        """Embeds the documents in the given directory.
-
-        Args:
-        ----
-            directory (str): PDF Directory.
-            file_ending (str): File ending of the documents.
-
-        """
-        if file_ending == ".pdf":
-            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=PyPDFium2Loader)
-        elif file_ending == ".txt":
-            loader = DirectoryLoader(directory, glob="*" + file_ending, loader_cls=TextLoader)
-        else:
-            msg = "File ending not supported."
-            raise ValueError(msg)
-
-        splitter = NLTKTextSplitter(length_function=len, chunk_size=500, chunk_overlap=75)
-
-        docs = loader.load_and_split(splitter)
-
-        logger.info(f"Loaded {len(docs)} documents.")
-        text_list = [doc.page_content for doc in docs]
-        metadata_list = [doc.metadata for doc in docs]
-
-        for m in metadata_list:
-            # only when there are / in the source
-            if "/" in m["source"]:
-                m["source"] = m["source"].split("/")[-1]
-
-        self.vector_db.add_texts(texts=text_list, metadatas=metadata_list)
-
-        logger.info("SUCCESS: Texts embedded.")
-
     def summarize_text(self, text: str) -> str:
         """Summarizes the given text using the OpenAI API.
 
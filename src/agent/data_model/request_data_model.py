@@ -16,12 +16,11 @@ class LLMProvider(str, Enum):
     @classmethod
     def from_normalized_value(cls, normalized_value: str) -> str:
         """Map the normalized value to the correct LLM Provider."""
-        mapping = {
-            "openai": cls.OPENAI,
-            "cohere": cls.COHERE,
-            "ollama": cls.OLLAMA,
-        }
-        return mapping.get(normalized_value)
+        return _PROVIDER_MAPPING.get(normalized_value)
+
+
+# built once from the enum instead of on every lookup
+_PROVIDER_MAPPING = {provider.value: provider for provider in LLMProvider}
 
 
 class Language(str, Enum):
@@ -3,8 +3,8 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from agent.backend.LLMStrategy import LLMContext, LLMStrategyFactory
 from agent.data_model.request_data_model import LLMProvider
+from agent.utils.vdb import get_embeddings_size, initialize_vector_db
 
 router = APIRouter()
 
@@ -23,6 +23,7 @@ def create_collection(llm_provider: LLMProvider, collection_name: str) -> JSONRe
         JSONResponse: Success Message.
 
     """
-    service = LLMContext(LLMStrategyFactory.get_strategy(strategy_type=llm_provider, token="", collection_name=collection_name))
-    service.createe_collection_collection(name=collection_name)
+    # create directly against the DB: a vector-store-backed service would
+    # validate the collection config of a collection that does not exist yet
+    initialize_vector_db(collection_name=collection_name, embeddings_size=get_embeddings_size(llm_provider=llm_provider))
     return JSONResponse(content={"message": f"Collection {collection_name} created."})
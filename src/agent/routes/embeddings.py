@@ -3,25 +3,32 @@
 import asyncio
 from pathlib import Path
 
-from fastapi import APIRouter, File, UploadFile
+from fastapi import APIRouter, File, Form, UploadFile
 from loguru import logger
 
 from agent.backend.LLMStrategy import LLMContext, LLMStrategyFactory
-from agent.data_model.request_data_model import EmbeddTextRequest, LLMBackend, LLMProvider
+from agent.data_model.request_data_model import EmbeddTextRequest, LLMBackend
 from agent.data_model.response_data_model import EmbeddingResponse
 from agent.utils.utility import create_tmp_folder
 
 router = APIRouter()
 
 
+async def _write_upload(file: UploadFile, file_path: Path) -> None:
+    """Write one uploaded file to disk without blocking the event loop."""
+    content = await file.read()
+    await asyncio.to_thread(file_path.write_bytes, content)
+
+
 @router.post("/documents", tags=["embeddings"])
-async def post_embed_documents(llm_backend: LLMBackend, files: list[UploadFile] = File(...), file_ending: str = ".pdf") -> EmbeddingResponse:
+async def post_embed_documents(files: list[UploadFile] = File(...), llm_backend: str = Form("{}"), file_ending: str = ".pdf") -> EmbeddingResponse:
     """Embeds multiple documents from files.
 
     Args:
     ----
-        llm_backend (LLMBackend): Which LLM backend to use.
         files (list[UploadFile], optional): The uploaded files. Defaults to File(...).
+        llm_backend (str, optional): JSON encoded LLMBackend, sent as a form
+            field because a multipart request cannot carry a JSON body.
         file_ending (str, optional): The file ending of the uploaded file. Defaults to ".pdf".
 
     Raises:
@@ -35,9 +42,10 @@ async def post_embed_documents(llm_backend: LLMBackend, files: list[UploadFile]
 
     """
     logger.info("Embedding Multiple Documents")
+    backend = LLMBackend.model_validate_json(llm_backend)
     tmp_dir = create_tmp_folder()
 
-    service = LLMContext(LLMStrategyFactory.get_strategy(strategy_type=LLMProvider.ALEPH_ALPHA, collection_name=llm_backend.collection_name))
+    service = LLMContext(LLMStrategyFactory.get_strategy(strategy_type=backend.llm_provider, collection_name=backend.collection_name))
     file_names = []
 
     # Use asyncio to write files concurrently
@@ -49,12 +57,12 @@ async def post_embed_documents(llm_backend: LLMBackend, files: list[UploadFile]
             raise ValueError(msg)
 
         file_path = Path(tmp_dir) / file_name
-        write_tasks.append(asyncio.to_thread(file.save, file_path))
+        write_tasks.append(_write_upload(file, file_path))
         file_names.append(file_name)
 
     await asyncio.gather(*write_tasks)
 
-    service.embed_documents(folder=tmp_dir, file_ending=file_ending)
+    await service.aembed_documents(directory=tmp_dir, file_ending=file_ending)
     return EmbeddingResponse(status="success", files=file_names)
 
 
@@ -66,5 +74,5 @@ async def embedd_text(embedding: EmbeddTextRequest, llm_backend: LLMBackend) ->
     tmp_dir = create_tmp_folder()
     with (Path(tmp_dir) / (embedding.file_name + ".txt")).open("w") as f:
         f.write(embedding.text)
-    service.embed_documents(directory=tmp_dir, file_ending=".txt")
+    await service.aembed_documents(directory=tmp_dir, file_ending=".txt")
     return EmbeddingResponse(status="success", files=[embedding.file_name])
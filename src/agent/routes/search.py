@@ -15,7 +15,7 @@ router = APIRouter()
 def search(search: SearchParams, llm_backend: LLMBackend) -> list[SearchResponse]:
     """Search for documents."""
     logger.info("Searching for Documents")
-    service = LLMContext(LLMStrategyFactory.get_strategy(strategy_type=llm_backend.llm_provider, token=llm_backend.token, collection_name=llm_backend.collection_name))
+    service = LLMContext(LLMStrategyFactory.get_strategy(strategy_type=llm_backend.llm_provider, collection_name=llm_backend.collection_name))
     docs = service.search(search=search)
 
     if not docs:
@@ -23,4 +23,4 @@ def search(search: SearchParams, llm_backend: LLMBackend) -> list[SearchResponse
         return JSONResponse(content={"message": "No documents found."})
 
     logger.info(f"Found {len(docs)} documents.")
-    return [SearchResponse(text=d[0].page_content, page=d[0].metadata["page"], source=d[0].metadata["source"], score=d[1]) for d in docs]
+    return [SearchResponse(text=doc.page_content, page=doc.metadata.get("page", 0), source=doc.metadata["source"], score=doc.metadata["score"]) for doc in docs]
@@ -0,0 +1,80 @@
+"""Caching utilities."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
+from langchain_core.embeddings import Embeddings
+
+EMBEDDING_CACHE_DIR = ".embedding_cache"
+
+
+class QueryCache:
+    """A small in-memory TTL + LRU cache for retrieval results.
+
+    Repeated queries against the same collection skip the query embedding and
+    the vector DB round-trip entirely for the lifetime of an entry.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0) -> None:
+        """Init the Query Cache.
+
+        Args:
+        ----
+            max_size (int): Maximum number of cached queries before LRU eviction.
+            ttl (float): Time to live of an entry in seconds.
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        # sync routes run in a threadpool, so expiry and eviction must not race
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> object | None:
+        """Return the cached result for a key or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            timestamp, result = entry
+            if time.monotonic() - timestamp > self.ttl:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: tuple, result: object) -> None:
+        """Store a result and evict the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+# shared across all retrievers; keyed by collection and search parameters
+query_cache = QueryCache()
+
+
+def cache_embeddings(embedding: Embeddings, namespace: str) -> CacheBackedEmbeddings:
+    """Wrap an embedder with a persistent content-hash keyed cache.
+
+    Document embeddings are stored on disk keyed by the hash of the chunk text
+    and the model namespace, so re-ingesting unchanged chunks never hits the
+    remote embedding API again.
+
+    Args:
+    ----
+        embedding (Embeddings): The embedder to wrap.
+        namespace (str): Cache namespace, usually the embedding model name.
+
+    Returns:
+    -------
+        CacheBackedEmbeddings: The cache backed embedder.
+
+    """
+    store = LocalFileStore(EMBEDDING_CACHE_DIR)
+    return CacheBackedEmbeddings.from_bytes_store(embedding, store, namespace=namespace)
@@ -2,9 +2,9 @@
 
 import uuid
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 
-from langchain.prompts import PromptTemplate
 from langchain_core.documents import Document
 from lingua import Language, LanguageDetectorBuilder
 from loguru import logger
@@ -50,9 +50,13 @@ def combine_text_from_list(input_list: list) -> str:
     return combined_text
 
 
-def load_prompt_template(prompt_name: str, task: str) -> PromptTemplate:
+@lru_cache(maxsize=64)
+def load_prompt_template(prompt_name: str, task: str) -> str:
     """Loading a task specific prompt template.
 
+    The template file is read once per (prompt_name, task) pair and served
+    from the cache afterwards instead of hitting the disk on every call.
+
     Args:
     ----
         prompt_name (str): Name of the prompt template
@@ -64,7 +68,7 @@ def load_prompt_template(prompt_name: str, task: str) -> PromptTemplate:
 
     Returns:
     -------
-        PromptTemplate: The loaded prompt template
+        str: The loaded prompt template
 
     """
     try:
@@ -92,16 +96,21 @@ def convert_qdrant_result_to_retrieval_results(docs: list) -> list[RetrievalResu
     return [RetrievalResults(document=doc[0].page_content, score=doc[1], metadata=doc[0].metadata) for doc in docs]
 
 
-def create_tmp_folder() -> str:
+def create_tmp_folder(base_dir: Path | None = None) -> str:
     """Creates a temporary folder for files to store.
 
-    Returns
+    Args:
+    ----
+        base_dir (Path | None): Parent directory for the folder. Defaults to
+            the current working directory.
+
+    Returns:
     -------
         str: The directory name.
 
     """
     # Create a temporary folder to save the files
-    tmp_dir = Path.cwd() / f"tmp_{uuid.uuid4()}"
+    tmp_dir = (base_dir or Path.cwd()) / f"tmp_{uuid.uuid4()}"
     try:
         tmp_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created new folder {tmp_dir}.")
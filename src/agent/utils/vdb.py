@@ -1,6 +1,7 @@
 """Vector Database Utilities."""
 
 import os
+from functools import lru_cache
 
 from langchain_core.embeddings import Embeddings
 from langchain_qdrant import FastEmbedSparse, QdrantVectorStore, RetrievalMode
@@ -9,7 +10,33 @@ from omegaconf import DictConfig
 from qdrant_client import QdrantClient, models
 from ultra_simple_config import load_config
 
-sparse_embeddings = FastEmbedSparse(model_name="Qdrant/bm25")
+
+@lru_cache(maxsize=1)
+def get_sparse_embeddings() -> FastEmbedSparse:
+    """Load the sparse embedding model on first use instead of at import time."""
+    return FastEmbedSparse(model_name="Qdrant/bm25")
+
+
+@lru_cache(maxsize=4)
+def get_qdrant_client(url: str, port: int, grpc_port: int, prefer_grpc: bool) -> QdrantClient:
+    """Create or reuse a Qdrant client for the given connection parameters.
+
+    The client is cached so repeated service or route calls share one
+    connection pool instead of paying the setup cost per request.
+
+    Args:
+    ----
+        url (str): URL of the Qdrant instance.
+        port (int): REST port of the Qdrant instance.
+        grpc_port (int): gRPC port of the Qdrant instance.
+        prefer_grpc (bool): Whether to use the gRPC transport.
+
+    Returns:
+    -------
+        QdrantClient: The shared Qdrant client.
+
+    """
+    return QdrantClient(url, port=port, grpc_port=grpc_port, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=prefer_grpc)
 
 
 def init_vdb(cfg: DictConfig, collection_name: str, embedding: Embeddings) -> QdrantVectorStore:
@@ -26,7 +53,7 @@ def init_vdb(cfg: DictConfig, collection_name: str, embedding: Embeddings) -> Qd
         Qdrant: Established Connection to the Vector DB including Embeddings.
 
     """
-    qdrant_client = QdrantClient(cfg.qdrant.url, port=cfg.qdrant.port, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=cfg.qdrant.prefer_grpc)
+    qdrant_client = get_qdrant_client(cfg.qdrant.url, cfg.qdrant.port, cfg.qdrant.grpc_port, cfg.qdrant.prefer_grpc)
 
     logger.info(f"USING COLLECTION: {collection_name}")
 
@@ -34,7 +61,7 @@ def init_vdb(cfg: DictConfig, collection_name: str, embedding: Embeddings) -> Qd
         client=qdrant_client,
         collection_name=collection_name,
         embedding=embedding,
-        sparse_embedding=sparse_embeddings,
+        sparse_embedding=get_sparse_embeddings(),
         retrieval_mode=RetrievalMode.HYBRID,
         sparse_vector_name="fast-sparse-bm25",
     )
@@ -64,7 +91,7 @@ def load_vec_db_conn(cfg: DictConfig) -> tuple[QdrantClient, DictConfig]:
                                          original configuration object.
 
     """
-    return (QdrantClient(cfg.qdrant.url, port=cfg.qdrant.port, api_key=os.getenv("QDRANT_API_KEY"), prefer_grpc=cfg.qdrant.prefer_grpc), cfg)
+    return (get_qdrant_client(cfg.qdrant.url, cfg.qdrant.port, cfg.qdrant.grpc_port, cfg.qdrant.prefer_grpc), cfg)
 
 
 def initialize_vector_db(collection_name: str, embeddings_size: int) -> None:
@@ -84,6 +111,28 @@ def initialize_vector_db(collection_name: str, embeddings_size: int) -> None:
         generate_collection(collection_name=collection_name, embeddings_size=embeddings_size)
 
 
+@load_config("config/main.yml")
+def get_embeddings_size(cfg: DictConfig, llm_provider: str) -> int:
+    """Look up the configured embedding size of a provider.
+
+    Args:
+    ----
+        cfg (DictConfig): the configuration from the file.
+        llm_provider (str): The LLM provider.
+
+    Returns:
+    -------
+        int: The embedding size of the provider's embedding model.
+
+    """
+    sizes = {
+        "openai": cfg.openai_embeddings.size,
+        "cohere": cfg.cohere_embeddings.size,
+        "ollama": cfg.ollama_embeddings.size,
+    }
+    return sizes[llm_provider]
+
+
 def generate_collection(collection_name: str, embeddings_size: int) -> None:
     """Generate a collection for a given backend.
 
@@ -100,6 +149,9 @@ def generate_collection(collection_name: str, embeddings_size: int) -> None:
         collection_name=collection_name,
         vectors_config=models.VectorParams(size=embeddings_size, distance=models.Distance.COSINE),
         sparse_vectors_config=qdrant_client.get_fastembed_sparse_vector_params(),
+        # keep int8-quantized vectors in RAM for search; originals stay on disk for rescoring
+        quantization_config=models.ScalarQuantization(scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, quantile=0.99, always_ram=True)),
+        on_disk_payload=True,
     )
     logger.info(f"SUCCESS: Collection {collection_name} created.")
 
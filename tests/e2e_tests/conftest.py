@@ -0,0 +1,148 @@
+"""Shared fixtures for the e2e tests."""
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+from fastapi.testclient import TestClient
+from langchain_community.embeddings import OllamaEmbeddings
+
+# the app builds provider SDK clients at import time, so dummy keys must be in
+# place before agent.api is imported — a fixture would run too late
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("COHERE_API_KEY", "test-key")
+
+from agent.api import app  # noqa: E402
+from agent.utils.utility import create_tmp_folder  # noqa: E402
+
+OPENAI_EMBEDDING_SIZE = 1536
+COHERE_EMBEDDING_SIZE = 1024
+OLLAMA_EMBEDDING_SIZE = 768
+
+
+@pytest.fixture(scope="session")
+def attention_pdf_bytes() -> bytes:
+    """The attention paper, read from disk once per session."""
+    return Path("tests/resources/1706.03762v5.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pytorch_pdf_bytes() -> bytes:
+    """The PyTorch paper, read from disk once per session."""
+    return Path("tests/resources/1912.01703v1.pdf").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def albert_text() -> str:
+    """The Einstein text resource, read from disk once per session."""
+    return Path("tests/resources/albert.txt").read_text()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_embedding_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Point the embedding cache at one session-wide temporary store.
+
+    The tests embed overlapping content; with one shared store only the first
+    occurrence of a chunk pays the embedding call, and the checkout stays free
+    of cache artifacts.
+    """
+    cache_dir = tmp_path_factory.mktemp("embedding_cache")
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr("agent.utils.caching.EMBEDDING_CACHE_DIR", str(cache_dir))
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(autouse=True)
+def isolated_tmp_root(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Create the upload tmp folders under pytest's per-test tmp_path.
+
+    pytest reclaims tmp_path on its own, so teardown needs no directory
+    tracking at all and parallel workers cannot touch each other's folders.
+    """
+    monkeypatch.setattr("agent.routes.embeddings.create_tmp_folder", partial(create_tmp_folder, base_dir=tmp_path))
+
+
+@pytest.fixture()
+def stub_llm_apis(monkeypatch: pytest.MonkeyPatch) -> Iterator[respx.MockRouter]:
+    """Stub the provider embedding backends with canned responses.
+
+    The embedding calls dominate the wall time of the e2e tests and need
+    provider credentials or a running Ollama; answering them locally keeps
+    the tests CPU-bound. OpenAI and Cohere are stubbed at the HTTP layer;
+    Ollama talks to its server through requests, which respx cannot
+    intercept, so it is stubbed at the embedder level. Requests to the app
+    under test and to local services pass through untouched.
+    """
+    def fake_embed_documents(_self: OllamaEmbeddings, texts: list[str]) -> list[list[float]]:
+        return [[0.0] * OLLAMA_EMBEDDING_SIZE for _ in texts]
+
+    def fake_embed_query(_self: OllamaEmbeddings, _text: str) -> list[float]:
+        return [0.0] * OLLAMA_EMBEDDING_SIZE
+
+    monkeypatch.setattr(OllamaEmbeddings, "embed_documents", fake_embed_documents)
+    monkeypatch.setattr(OllamaEmbeddings, "embed_query", fake_embed_query)
+
+    with respx.mock(assert_all_called=False) as router:
+        router.route(host="test").pass_through()
+        router.route(host="testserver").pass_through()
+        router.route(host="localhost").pass_through()
+
+        def openai_embeddings(request: httpx.Request) -> httpx.Response:
+            texts = json.loads(request.content)["input"]
+            if isinstance(texts, str):
+                texts = [texts]
+            data = [{"object": "embedding", "index": i, "embedding": [0.0] * OPENAI_EMBEDDING_SIZE} for i in range(len(texts))]
+            return httpx.Response(200, json={"object": "list", "data": data, "model": "text-embedding-ada-002", "usage": {"prompt_tokens": 0, "total_tokens": 0}})
+
+        def cohere_embed(request: httpx.Request) -> httpx.Response:
+            texts = json.loads(request.content).get("texts", [])
+            return httpx.Response(200, json={"id": "stub", "embeddings": [[0.0] * COHERE_EMBEDDING_SIZE for _ in texts], "texts": texts, "meta": {"api_version": {"version": "1"}}})
+
+        router.post(url__regex=r"https://api\.openai\.com/v1/embeddings").mock(side_effect=openai_embeddings)
+        router.post(url__regex=r"https://api\.cohere\.(com|ai)/v\d+/embed").mock(side_effect=cohere_embed)
+        yield router
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """One TestClient for the whole session.
+
+    Entering the client runs the app lifespan exactly once, so instrumentation
+    setup, nltk downloads and vector DB initialization are paid a single time
+    instead of never (module-level clients skip the lifespan entirely).
+    Server errors surface as status codes so failure paths assert on responses.
+    """
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop where it is installed.
+
+    The libuv loop shaves scheduling and syscall overhead off every in-process
+    ASGI round-trip; the stock policy is the fallback on platforms without it.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_client() -> AsyncIterator[httpx.AsyncClient]:
+    """One AsyncClient shared by all async tests of a module.
+
+    The explicit ASGITransport calls the app coroutine in-process without a
+    network socket or the sync-to-async portal thread TestClient uses.
+    """
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
@@ -1,30 +1,32 @@
 """API Tests."""
-import os
-import shutil
+import asyncio
+import json
 import uuid
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 import pytest
-from fastapi.testclient import TestClient
 
-from agent.api import app
+from agent.data_model.request_data_model import LLMProvider
 
 if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
     from httpx._models import Response
 http_ok = 200
-client: TestClient = TestClient(app)
+# one provider table instead of per-test literals, so the cases stay in
+# lockstep with the enum
+PROVIDERS = [provider.value for provider in LLMProvider]
+http_unprocessable = 422
 
 
-def test_read_root() -> None:
+def test_read_root(client: TestClient) -> None:
     """Test the root method."""
     response: Response = client.get("/")
     assert response.status_code == http_ok
 
 
-@pytest.mark.parametrize("provider", ["aa", "gpt4all", "openai", "cohere", "ollama"])
-def test_create_collection(provider: str) -> None:
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_create_collection(provider: str, client: TestClient) -> None:
     """Test the create_collection function.
 
     Args:
@@ -37,8 +39,9 @@ def test_create_collection(provider: str) -> None:
     assert response.status_code == http_ok
 
 
-@pytest.mark.parametrize("provider", ["aa", "gpt4all", "openai"])
-def test_semantic_search(provider: str) -> None:
+@pytest.mark.usefixtures("stub_llm_apis")
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_semantic_search(provider: str, client: TestClient) -> None:
     """Test the semantic_search function."""
     response: Response = client.post(
         "/semantic/search",
@@ -52,65 +55,74 @@ def test_semantic_search(provider: str) -> None:
     assert response.json() is not None
 
 
-@pytest.mark.parametrize("provider", ["aa", "gpt4all", "openai"])
-def test_embeddings_text(provider: str) -> None:
+@pytest.mark.usefixtures("stub_llm_apis")
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_embeddings_text(provider: str, albert_text: str, client: TestClient) -> None:
     """Test the embedd_text function."""
-    # load text
-    with Path("tests/resources/albert.txt").open() as f:
-        text = f.read()
-
     response: Response = client.post(
         "/embeddings/string/",
-        json={"embedding": {"text": text, "file_name": "file", "seperator": "###"}, "llm_backend": {"llm_provider": provider, "token": "", "collection_name": ""}},
+        json={"embedding": {"text": albert_text, "file_name": "file", "seperator": "###"}, "llm_backend": {"llm_provider": provider, "token": "", "collection_name": ""}},
     )
     assert response.status_code == http_ok
 
 
-@pytest.mark.asyncio()
-@pytest.mark.parametrize("provider", ["aa", "openai", "gpt4all"])
-async def test_upload_documents(provider: str) -> None:
-    """Testing the upload of multiple documents."""
-    async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
-        with Path("tests/resources/1706.03762v5.pdf").open("rb") as file1, Path("tests/resources/1912.01703v1.pdf").open("rb") as file2:
-            files = [file1, file2]
-            response: Response = await ac.post(
-                "/embeddings/documents",
-                json={"llm_backend": {"llm_provider": provider, "token": "", "collection_name": ""}},
-                params={"file_ending": ".pdf"},
-                files=[("files", file) for file in files],
-            )
-
-    assert response.status_code == http_ok
-    assert response.json() == {
-        "status": "success",
-        "files": ["1706.03762v5.pdf", "1912.01703v1.pdf"],
-    }
-
-    # Clean up temporary folders
-    for entry in os.scandir():
-        if entry.name.startswith("tmp_") and entry.is_dir():
-            shutil.rmtree(entry.path)
-
-
-@pytest.mark.asyncio()
-@pytest.mark.parametrize("provider", ["aa", "openai", "gpt4all"])
-async def test_embedd_one_document(provider: str) -> None:
-    """Testing the upload of one document."""
-    async with httpx.AsyncClient(app=app, base_url="http://test") as ac:
-        with Path("tests/resources/1706.03762v5.pdf").open("rb") as tmp_file:
-            # Use tmp_file here
-            response: Response = await ac.post(
-                "/embeddings/documents",
-                json={"llm_backend": {"llm_provider": provider, "token": "", "collection_name": ""}},
-                files=[("files", tmp_file)],
-            )
+def test_semantic_search_invalid_provider(client: TestClient) -> None:
+    """Test that an unknown provider is rejected with a validation error."""
+    response: Response = client.post(
+        "/semantic/search",
+        json={
+            "search": {"query": "What is Attention?", "amount": 3},
+            "llm_backend": {"llm_provider": "not_a_provider", "token": "", "collection_name": ""},
+            "filtering": {"threshold": 0, "collection_name": "", "filter": {}},
+        },
+    )
+    assert response.status_code == http_unprocessable
+
+
+@pytest.mark.slow()
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.usefixtures("stub_llm_apis")
+async def test_upload_documents(async_client: httpx.AsyncClient, attention_pdf_bytes: bytes, pytorch_pdf_bytes: bytes) -> None:
+    """Testing the upload of multiple documents for all providers concurrently."""
+
+    async def upload(provider: str) -> httpx.Response:
+        return await async_client.post(
+            "/embeddings/documents",
+            # multipart requests cannot carry a JSON body, so the backend
+            # selection travels as a JSON encoded form field
+            data={"llm_backend": json.dumps({"llm_provider": provider, "collection_name": ""})},
+            params={"file_ending": ".pdf"},
+            # both PDFs go out in one multipart request; the cached bytes are
+            # handed to httpx as-is instead of being copied into BytesIO per case
+            files=[
+                ("files", ("1706.03762v5.pdf", attention_pdf_bytes, "application/pdf")),
+                ("files", ("1912.01703v1.pdf", pytorch_pdf_bytes, "application/pdf")),
+            ],
+        )
+
+    responses = await asyncio.gather(*(upload(provider) for provider in PROVIDERS))
+
+    for response in responses:
         assert response.status_code == http_ok
         assert response.json() == {
             "status": "success",
-            "files": ["1706.03762v5.pdf"],
+            "files": ["1706.03762v5.pdf", "1912.01703v1.pdf"],
         }
 
-    # Clean up temporary folders
-    for entry in os.scandir():
-        if entry.name.startswith("tmp_") and entry.is_dir():
-            shutil.rmtree(entry.path)
+
+@pytest.mark.slow()
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.usefixtures("stub_llm_apis")
+@pytest.mark.parametrize("provider", PROVIDERS)
+async def test_embedd_one_document(provider: str, async_client: httpx.AsyncClient, attention_pdf_bytes: bytes) -> None:
+    """Testing the upload of one document."""
+    response: Response = await async_client.post(
+        "/embeddings/documents",
+        data={"llm_backend": json.dumps({"llm_provider": provider, "collection_name": ""})},
+        files=[("files", ("1706.03762v5.pdf", attention_pdf_bytes, "application/pdf"))],
+    )
+    assert response.status_code == http_ok
+    assert response.json() == {
+        "status": "success",
+        "files": ["1706.03762v5.pdf"],
+    }
@@ -0,0 +1,40 @@
+"""Tests for the ingestion pipeline below the HTTP layer."""
+import pytest
+from langchain_core.documents import Document
+
+from agent.backend.LLMBase import _load_file, _prepare_chunks
+
+
+@pytest.fixture(scope="module")
+def attention_documents() -> list[Document]:
+    """Parse the attention paper once for all tests of this module."""
+    return _load_file("tests/resources/1706.03762v5.pdf", ".pdf")
+
+
+def test_load_file_parses_pdf(attention_documents: list[Document]) -> None:
+    """Test that the PDF loader yields pages with text and a source."""
+    assert attention_documents
+    assert all(doc.page_content for doc in attention_documents)
+    assert all(doc.metadata["source"].endswith(".pdf") for doc in attention_documents)
+
+
+def test_load_file_parses_text() -> None:
+    """Test that plain text files go through the text loader."""
+    documents = _load_file("tests/resources/albert.txt", ".txt")
+
+    assert len(documents) == 1
+    assert documents[0].page_content
+
+
+def test_prepare_chunks_sorts_and_strips_sources() -> None:
+    """Test that chunks are sorted by length and sources reduced to file names."""
+    docs = [
+        Document(page_content="a longer chunk of text", metadata={"source": "/some/tmp/folder/paper.pdf", "page": 1}),
+        Document(page_content="short", metadata={"source": "notes.txt"}),
+    ]
+
+    text_list, metadata_list = _prepare_chunks(docs)
+
+    assert text_list == ["short", "a longer chunk of text"]
+    assert [metadata["source"] for metadata in metadata_list] == ["notes.txt", "paper.pdf"]
+    assert metadata_list[1]["page"] == 1
